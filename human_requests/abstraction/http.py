@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from urllib.parse import parse_qs, urlparse, urlunparse
 
@@ -34,43 +35,100 @@ class HttpMethod(Enum):
 
 @dataclass(frozen=True)
 class URL:
-    """A dataclass containing the parsed URL components."""
+    """A dataclass containing the parsed URL components.
+
+    Only `full_url` is accepted by the constructor; the other components are read-only
+    properties backed by a cached parse. An invalid port is rejected with `ValueError`
+    at construction time."""
+
+    # слоты объявлены вручную: кэши разбора не должны попадать в fields()/asdict()
+    __slots__ = ("full_url", "_parts", "_params")
 
     full_url: str
     """The full URL."""
-    base_url: str = ""
-    """The base URL, without query parameters."""
-    secure: bool = False
-    """Whether the URL is secure (https/wss)."""
-    protocol: str = ""
-    """The protocol of the URL."""
-    path: str = ""
-    """The path of the URL."""
-    domain_with_port: str = ""
-    """The domain of the URL with port."""
-    domain: str = ""
-    """The domain of the URL."""
-    port: Optional[int] = None
-    """The port of the URL."""
-    params: dict[str, list[str]] = field(default_factory=dict)
-    """A dictionary of query parameters."""
 
     def __post_init__(self) -> None:
-        parsed_url = urlparse(self.full_url)
-
-        object.__setattr__(self, "base_url", parsed_url._replace(query="").geturl())
-        object.__setattr__(self, "secure", parsed_url.scheme in ["https", "wss"])
-        object.__setattr__(self, "protocol", parsed_url.scheme)
-
-        object.__setattr__(self, "path", parsed_url.path)
-
-        full_domen = parsed_url.netloc.split(":")
-        object.__setattr__(self, "domain_with_port", parsed_url.netloc)
-        object.__setattr__(self, "domain", full_domen[0])
-        if len(full_domen) > 1:
-            object.__setattr__(self, "port", int(full_domen[1]))
-
-        object.__setattr__(self, "params", parse_qs(parsed_url.query))
+        # разбор закэширован по строке: повторяющиеся адреса стоят одного поиска в кэше,
+        # а ошибка в порте всплывает там же, где создан URL
+        self._parts: _ParsedURL
+        self._params: Optional[dict[str, list[str]]]
+        object.__setattr__(self, "_parts", _parse_url(self.full_url))
+        object.__setattr__(self, "_params", None)
+
+    def __reduce__(self) -> tuple[type["URL"], tuple[str]]:
+        # frozen + ручные слоты: восстанавливаем через __init__, кэши соберутся заново
+        return (type(self), (self.full_url,))
+
+    @property
+    def base_url(self) -> str:
+        """The base URL, without query parameters."""
+        return self._parts[0]
+
+    @property
+    def secure(self) -> bool:
+        """Whether the URL is secure (https/wss)."""
+        return self._parts[1]
+
+    @property
+    def protocol(self) -> str:
+        """The protocol of the URL."""
+        return self._parts[2]
+
+    @property
+    def path(self) -> str:
+        """The path of the URL."""
+        return self._parts[3]
+
+    @property
+    def domain_with_port(self) -> str:
+        """The domain of the URL with port."""
+        return self._parts[4]
+
+    @property
+    def domain(self) -> str:
+        """The domain of the URL."""
+        return self._parts[5]
+
+    @property
+    def port(self) -> Optional[int]:
+        """The port of the URL."""
+        return self._parts[6]
+
+    @property
+    def params(self) -> dict[str, list[str]]:
+        """A dictionary of query parameters."""
+        params = self._params
+        if params is None:
+            # кэш разбора общий между экземплярами — каждому URL отдаём свою копию
+            params = {k: list(v) for k, v in self._parts[7]}
+            object.__setattr__(self, "_params", params)
+        return params
+
+
+_ParsedURL = tuple[
+    str, bool, str, str, str, str, Optional[int], tuple[tuple[str, tuple[str, ...]], ...]
+]
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(full_url: str) -> _ParsedURL:
+    """Разбор URL, закэшированный по строке: повторяющиеся адреса не парсятся заново."""
+    parsed_url = urlparse(full_url)
+
+    full_domen = parsed_url.netloc.split(":")
+    port = int(full_domen[1]) if len(full_domen) > 1 else None
+    params = tuple((k, tuple(v)) for k, v in parse_qs(parsed_url.query).items())
+
+    return (
+        parsed_url._replace(query="").geturl(),
+        parsed_url.scheme in ["https", "wss"],
+        parsed_url.scheme,
+        parsed_url.path,
+        parsed_url.netloc,
+        full_domen[0],
+        port,
+        params,
+    )
 
 
 class Proxy:
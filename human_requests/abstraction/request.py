@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from ..human_page import HumanPage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FetchRequest:
     """Represents all the data passed in the request."""
 
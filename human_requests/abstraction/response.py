@@ -1,7 +1,10 @@
+import codecs
 import json
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from time import time
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
 
 from .http import URL
 from .request import FetchRequest
@@ -9,11 +12,49 @@ from .request import FetchRequest
 if TYPE_CHECKING:
     from ..human_page import HumanPage
 
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _charset_of(content_type: str) -> str:
+    """Каноническое имя кодировки из Content-Type (utf-8 по умолчанию).
+
+    Значений Content-Type у сайта обычно единицы, поэтому разбор кэшируется."""
+    match = _CHARSET_RE.search(content_type)
+    if match is None:
+        return "utf-8"
+    try:
+        name = codecs.lookup(match.group(1)).name
+        # lookup находит и нетекстовые кодеки (hex, base64, zlib...): их отсекает decode.
+        # Пустые bytes декодируются без проверки, поэтому пробуем один байт.
+        b"a".decode(name)
+    except UnicodeDecodeError:  # текстовый кодек, одного байта ему мало (utf-16)
+        pass
+    except (LookupError, UnicodeError):  # неизвестная/нетекстовая кодировка ("undefined")
+        return "utf-8"
+    return name
+
 
 @dataclass(frozen=True)
 class FetchResponse:
     """Represents the response of a request."""
 
+    # слоты объявлены вручную: кэш _text не должен попадать в fields()/asdict()
+    __slots__ = (
+        "request",
+        "page",
+        "url",
+        "headers",
+        "raw",
+        "status_code",
+        "status_text",
+        "redirected",
+        "type",
+        "duration",
+        "end_time",
+        "_text",
+    )
+
     request: FetchRequest
     """The request that was made."""
 
@@ -24,7 +65,7 @@ class FetchResponse:
     """The URL of the response. Due to redirects, it can differ from `request.url`."""
 
     headers: dict
-    """The headers of the response."""
+    """The headers of the response. Names are normalized to lower case."""
 
     raw: bytes
     """The raw body of the response."""
@@ -46,19 +87,42 @@ class FetchResponse:
     end_time: float
     """Current time in seconds since the Epoch."""
 
+    def __post_init__(self) -> None:
+        # HTTP-заголовки регистронезависимы: приводим имена один раз при создании
+        object.__setattr__(self, "headers", {k.lower(): v for k, v in self.headers.items()})
+        self._text: Optional[str]
+        object.__setattr__(self, "_text", None)
+
+    def __reduce__(self) -> tuple[Callable[..., "FetchResponse"], tuple[Any, ...]]:
+        # frozen + ручные слоты: восстанавливаем через __init__, _text соберётся заново
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self)))
+
     @property
     def text(self) -> str:
-        """The body of the response."""
-        defchar = "utf-8"
-        ct = self.headers.get("content-type", "")
-        charset = ct.split("charset=")[-1] if "charset=" in ct else defchar
-        return self.raw.decode(charset, errors="replace")
+        """The body of the response. Decoded once, then cached on the instance."""
+        text = self._text
+        if text is None:
+            charset = _charset_of(self.headers.get("content-type", ""))
+            try:
+                # строгий декодер быстрее; replace нужен только для битых тел
+                text = self.raw.decode(charset)
+            except UnicodeDecodeError:
+                text = self.raw.decode(charset, errors="replace")
+            object.__setattr__(self, "_text", text)
+        return text
 
     def json(self) -> dict | list:
-        to_return = json.loads(self.text)
-        assert isinstance(to_return, list) or isinstance(
-            to_return, dict
-        ), f"Response body is not JSON: {type(self.text).__name__}"
+        # json.loads принимает bytes: для utf-8 тела обходимся без промежуточного str
+        if _charset_of(self.headers.get("content-type", "")) == "utf-8":
+            try:
+                to_return = json.loads(self.raw)
+            except UnicodeDecodeError:
+                to_return = json.loads(self.text)
+        else:
+            to_return = json.loads(self.text)
+        assert isinstance(
+            to_return, (list, dict)
+        ), f"Response body is not JSON: {type(to_return).__name__}"
         return to_return
 
     def seconds_ago(self) -> float:
@@ -41,7 +41,7 @@ def _primary_brand(brands: Optional[BrandList]) -> Optional[Brand]:
 
 
 # ---------- Новые вложенные датаклассы ----------
-@dataclass
+@dataclass(slots=True)
 class Screen:
     width: Optional[int] = None
     height: Optional[int] = None
@@ -51,20 +51,20 @@ class Screen:
     pixelDepth: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowDetails:
     innerWidth: Optional[int] = None
     innerHeight: Optional[int] = None
     devicePixelRatio: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TouchSupport:
     maxTouchPoints: int = 0
     touchEvent: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Battery:
     level: Optional[float] = None
     charging: Optional[bool] = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -11,6 +12,15 @@ from playwright.async_api import Route
 from .fingerprint import Fingerprint
 from .human_page import HumanPage
 
+_FINGERPRINT_HTML_PATH = Path(__file__).parent / "fingerprint" / "fingerprint_gen.html"
+
+
+@lru_cache(maxsize=1)
+def _fingerprint_html() -> str:
+    """Страница сбора отпечатка читается с диска один раз за процесс."""
+    return _FINGERPRINT_HTML_PATH.read_text(encoding="utf-8")
+
+
 # ---- tiny helper to avoid repeating "get-or-create" for page wrappers ----
 
 
@@ -77,8 +87,7 @@ class HumanContext(BrowserContext):
         >>> fp.browser_name, fp.browser_version
         ('Chromium', '140.0.7339.16')
         """
-        HTML_PATH = Path(__file__).parent / "fingerprint" / "fingerprint_gen.html"
-        _HTML_FINGERPRINT = HTML_PATH.read_text(encoding="utf-8")
+        _HTML_FINGERPRINT = _fingerprint_html()
         headers = {}
 
         async def handler(route: Route, _req: PWRequest) -> None:
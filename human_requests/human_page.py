@@ -4,6 +4,7 @@ import base64
 import json
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Literal, Optional, cast
 from urllib.parse import urlsplit
@@ -22,6 +23,36 @@ from .tools import auto_wrap_methods, make_screenshot
 if TYPE_CHECKING:
     from .human_context import HumanContext
 
+_JS_FETCH_PATH = Path(__file__).parent / "fetch.js"
+
+# транспортные заголовки, которые нельзя отдавать в синтетическом ответе goto_render
+_TRANSPORT_HEADERS = frozenset(
+    {"content-length", "content-encoding", "transfer-encoding", "connection"}
+)
+
+
+@lru_cache(maxsize=1)
+def _js_fetch() -> str:
+    """Исходник fetch.js читается с диска один раз за процесс."""
+    return _JS_FETCH_PATH.read_text(encoding="utf-8")
+
+
+def _to_bytes(data: bytes | bytearray | memoryview | str) -> bytes:
+    return (
+        data
+        if isinstance(data, bytes)
+        else (
+            bytes(data)
+            if isinstance(data, (bytearray, memoryview))
+            else data.encode("utf-8", "replace")
+        )
+    )
+
+
+def _is_html(b: bytes) -> bool:
+    s = b[:512].lstrip().lower()
+    return s.startswith(b"<!doctype html") or s.startswith(b"<html") or b"<body" in s
+
 
 @dataclass
 @auto_wrap_methods(decorator=make_screenshot)
@@ -139,21 +170,6 @@ class HumanPage(Page):
         """
 
         # -------- helpers (локально и коротко) ---------------------------------
-        def _to_bytes(data: bytes | bytearray | memoryview | str) -> bytes:
-            return (
-                data
-                if isinstance(data, bytes)
-                else (
-                    bytes(data)
-                    if isinstance(data, (bytearray, memoryview))
-                    else data.encode("utf-8", "replace")
-                )
-            )
-
-        def _is_html(b: bytes) -> bool:
-            s = b[:512].lstrip().lower()
-            return s.startswith(b"<!doctype html") or s.startswith(b"<html") or b"<body" in s
-
         def _norm_args() -> tuple[str, bytes, int, dict[str, str]]:
             if isinstance(first, FetchResponse):
                 url = first.url.full_url
@@ -168,8 +184,7 @@ class HumanPage(Page):
                 code = int(goto_kwargs.pop("status_code", 200))
                 hdrs = dict(goto_kwargs.pop("headers", {}) or {})
             # убрать транспортные, поставить content-type при html
-            drop = {"content-length", "content-encoding", "transfer-encoding", "connection"}
-            clean = {k: v for k, v in hdrs.items() if k.lower() not in drop}
+            clean = {k: v for k, v in hdrs.items() if k.lower() not in _TRANSPORT_HEADERS}
             if body and not any(k.lower() == "content-type" for k in clean) and _is_html(body):
                 clean["content-type"] = "text/html; charset=utf-8"
             return url, body, code, clean
@@ -269,19 +284,28 @@ class HumanPage(Page):
         if retry < 0:
             raise ValueError("retry must be >= 0")
 
-        declared_headers = {k.lower(): v for k, v in (headers or {}).items()}
-        js_headers = {k: v for k, v in declared_headers.items() if k != "referer"}
-        js_ref = referrer or declared_headers.get("referer")
+        # один проход: приводим имена к нижнему регистру и сразу отделяем referer для JS
+        declared_headers: dict[str, str] = {}
+        js_headers: dict[str, str] = {}
+        declared_ref: Optional[str] = None
+        for name, value in (headers or {}).items():
+            name = name.lower()
+            declared_headers[name] = value
+            if name == "referer":
+                declared_ref = value
+            else:
+                js_headers[name] = value
+        js_ref = referrer or declared_ref
 
         js_body: Any = body
         if isinstance(body, (dict, list)):
-            js_body = json.dumps(body, ensure_ascii=False)
+            # компактные разделители: меньше payload для evaluate и для сети
+            js_body = json.dumps(body, ensure_ascii=False, separators=(",", ":"))
             js_headers["content-type"] = "application/json"
 
         start_t = time.perf_counter()
 
-        _JS_PATH = Path(__file__).parent / "fetch.js"
-        JS_FETCH = _JS_PATH.read_text(encoding="utf-8")
+        JS_FETCH = _js_fetch()
 
         eval_payload = dict(
             url=url,
@@ -310,9 +334,10 @@ class HumanPage(Page):
         b64 = result.get("bodyB64")
         raw = base64.b64decode(b64) if isinstance(b64, str) else b""
 
-        # Нормализуем заголовки: если raw есть,
-        # уберём transport-атрибуты, чтобы не путать потребителя
-        resp_headers = {k.lower(): v for k, v in (result.get("headers") or {}).items()}
+        # Имена заголовков fetch.js уже отдаёт в нижнем регистре (FetchResponse всё равно
+        # нормализует их сам), а результат evaluate — свежий dict: второй проход не нужен.
+        # Если raw есть, уберём transport-атрибуты, чтобы не путать потребителя
+        resp_headers: dict[str, str] = result.get("headers") or {}
         if raw:
             resp_headers.pop("content-encoding", None)
             resp_headers.pop("content-length", None)
@@ -331,6 +356,7 @@ class HumanPage(Page):
         resp_model = FetchResponse(
             page=self,
             request=req_model,
+            # отдельный объект: у каждого URL свой изменяемый params, разбор берётся из кэша
             url=URL(full_url=result.get("finalUrl") or url),
             headers=resp_headers,
             raw=raw,  # всегда bytes; пусто если CORS не дал читать тело
@@ -5,6 +5,7 @@ import re
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Callable, Dict, Iterable, List, Optional, Pattern, Set, Union
 from urllib.parse import urlsplit, urlunsplit
 
@@ -19,7 +20,7 @@ class WaitSource(Enum):
     ALL = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaitHeader:
     source: WaitSource = WaitSource.ALL  # источник: запросы/ответы/оба
     headers: Optional[List[str]] = None  # список имён заголовков (case-insensitive)
@@ -32,8 +33,20 @@ class WaitHeader:
 
 # --- SNIFFER ------------------------------------------------------------------
 
+
+@lru_cache(maxsize=4096)
+def _default_url_key(u: str) -> str:
+    # запрос и ответ приходят с одним URL, ресурсы повторяются — разбираем строку один раз
+    us = urlsplit(u)
+    path = us.path.rstrip("/") or "/"
+    return urlunsplit(us._replace(path=path, fragment=""))
+
+
 UrlFilter = Optional[Union[Callable[[str], bool], str, Pattern[str]]]
 
+# верхняя граница кэша имён заголовков (имена приходят от сервера — не даём расти бесконечно)
+_NAME_CACHE_MAX = 1024
+
 
 class HeaderAnomalySniffer:
     """Собирает НЕстандартные заголовки запросов/ответов по всему BrowserContext.
@@ -132,17 +145,12 @@ class HeaderAnomalySniffer:
         self._allowed_pref = tuple(self._STD_PREFIXES) + tuple(allowed_prefixes)
         self._include_sub = include_subresources
 
-        # нормализация URL по умолчанию: без фрагмента и без хвостового "/"
-        if url_key:
-            self._url_key = url_key
-        else:
-
-            def _default_url_key(u: str) -> str:
-                us = urlsplit(u)
-                path = us.path.rstrip("/") or "/"
-                return urlunsplit(us._replace(path=path, fragment=""))
+        # кэш классификации: исходное имя -> имя в нижнем регистре (аномалия) или None
+        self._req_names: Dict[str, Optional[str]] = {}
+        self._resp_names: Dict[str, Optional[str]] = {}
 
-            self._url_key = _default_url_key
+        # нормализация URL по умолчанию: без фрагмента и без хвостового "/"
+        self._url_key = url_key or _default_url_key
 
         # фильтр URL: callable/regex/None
         self._url_filter_fn: Optional[Callable[[str], bool]] = None
@@ -287,7 +295,7 @@ class HeaderAnomalySniffer:
         if self._url_filter_fn and not self._url_filter_fn(url):
             return
         headers: Dict[str, str] = getattr(req, "headers", {}) or {}
-        unknown = {k.lower(): v for k, v in headers.items() if self._is_unknown_req(k)}
+        unknown = self._unknown_headers(headers, self._req_names, self._is_unknown_req)
         if not unknown:
             return
         async with self._lock:
@@ -303,7 +311,7 @@ class HeaderAnomalySniffer:
         if self._url_filter_fn and not self._url_filter_fn(url):
             return
         headers: Dict[str, str] = await resp.all_headers()
-        unknown = {k.lower(): v for k, v in headers.items() if self._is_unknown_resp(k)}
+        unknown = self._unknown_headers(headers, self._resp_names, self._is_unknown_resp)
         if not unknown:
             return
         async with self._lock:
@@ -315,6 +323,25 @@ class HeaderAnomalySniffer:
 
     # ---------- utils ----------
 
+    @staticmethod
+    def _unknown_headers(
+        headers: Dict[str, str],
+        names: Dict[str, Optional[str]],
+        is_unknown: Callable[[str], bool],
+    ) -> Dict[str, str]:
+        # одни и те же имена приходят в каждом запросе: классифицируем и lower() один раз
+        out: Dict[str, str] = {}
+        for k, v in headers.items():
+            try:
+                n = names[k]
+            except KeyError:
+                n = k.lower() if is_unknown(k) else None
+                if len(names) < _NAME_CACHE_MAX:
+                    names[k] = n
+            if n is not None:
+                out[n] = v
+        return out
+
     def _is_unknown_req(self, name: str) -> bool:
         n = name.lower()
         return n not in self._req_allow and not n.startswith(self._allowed_pref)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+
+from human_requests.network_analyzer import anomaly_sniffer
+from human_requests.network_analyzer.anomaly_sniffer import HeaderAnomalySniffer
+
+
+class _CountingClassifier:
+    def __init__(self, unknown: set[str]) -> None:
+        self._unknown = unknown
+        self.calls: list[str] = []
+
+    def __call__(self, name: str) -> bool:
+        self.calls.append(name)
+        return name.lower() in self._unknown
+
+
+def test_unknown_headers_classifies_names_case_insensitively() -> None:
+    is_unknown = _CountingClassifier({"x-token"})
+    names: dict[str, Optional[str]] = {}
+
+    out = HeaderAnomalySniffer._unknown_headers(
+        {"X-Token": "a", "Accept": "*/*"}, names, is_unknown
+    )
+    assert out == {"x-token": "a"}
+
+    out = HeaderAnomalySniffer._unknown_headers(
+        {"x-token": "b", "accept": "*/*"}, names, is_unknown
+    )
+    assert out == {"x-token": "b"}
+    assert names == {"X-Token": "x-token", "Accept": None, "x-token": "x-token", "accept": None}
+
+
+def test_unknown_headers_classifies_each_name_once() -> None:
+    is_unknown = _CountingClassifier({"x-token"})
+    names: dict[str, Optional[str]] = {}
+    headers = {"x-token": "a", "accept": "*/*"}
+
+    for _ in range(3):
+        assert HeaderAnomalySniffer._unknown_headers(headers, names, is_unknown) == {"x-token": "a"}
+
+    assert is_unknown.calls == ["x-token", "accept"]
+
+
+def test_unknown_headers_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(anomaly_sniffer, "_NAME_CACHE_MAX", 2)
+    is_unknown = _CountingClassifier({"x-a", "x-b", "x-c"})
+    names: dict[str, Optional[str]] = {}
+
+    out = HeaderAnomalySniffer._unknown_headers(
+        {"x-a": "1", "x-b": "2", "x-c": "3"}, names, is_unknown
+    )
+
+    # за пределами кэша имена по-прежнему классифицируются, просто не запоминаются
+    assert out == {"x-a": "1", "x-b": "2", "x-c": "3"}
+    assert names == {"x-a": "x-a", "x-b": "x-b"}
+
+
+def test_unknown_headers_matches_sniffer_classification() -> None:
+    sniffer = HeaderAnomalySniffer(extra_response_allow=["X-Allowed"])
+    headers = {"Content-Type": "a", "x-allowed": "b", "X-Custom": "c", "x-custom-2": "d"}
+
+    out = sniffer._unknown_headers(headers, sniffer._resp_names, sniffer._is_unknown_resp)
+
+    assert out == {"x-custom": "c", "x-custom-2": "d"}
+
+
+@pytest.mark.parametrize(
+    ("url", "key"),
+    [
+        ("https://example.com/api/items/", "https://example.com/api/items"),
+        ("https://example.com/api/items#frag", "https://example.com/api/items"),
+        ("https://example.com/api/items/?q=1#frag", "https://example.com/api/items?q=1"),
+        ("https://example.com", "https://example.com/"),
+        ("https://example.com/", "https://example.com/"),
+        ("https://example.com///", "https://example.com/"),
+    ],
+)
+def test_default_url_key_normalization(url: str, key: str) -> None:
+    assert anomaly_sniffer._default_url_key(url) == key
+    # повторный вызов берётся из кэша и даёт тот же результат
+    assert anomaly_sniffer._default_url_key(url) == key
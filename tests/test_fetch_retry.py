@@ -5,6 +5,7 @@ from typing import cast
 
 import pytest
 
+from human_requests.abstraction import HttpMethod
 from human_requests.human_page import HumanPage
 
 
@@ -25,9 +26,11 @@ class _FakePage:
     def __init__(self, results: list[dict[str, object]]) -> None:
         self._results = list(results)
         self.evaluate_calls = 0
+        self.payloads: list[dict[str, object]] = []
 
-    async def evaluate(self, _script: str, _payload: dict[str, object]) -> dict[str, object]:
+    async def evaluate(self, _script: str, payload: dict[str, object]) -> dict[str, object]:
         self.evaluate_calls += 1
+        self.payloads.append(payload)
         assert self._results, "No evaluate results configured"
         return self._results.pop(0)
 
@@ -87,3 +90,73 @@ async def test_fetch_retry_must_be_non_negative() -> None:
     page = _FakePage([_ok_result()])
     with pytest.raises(ValueError, match=r"retry must be >= 0"):
         await HumanPage.fetch(cast(HumanPage, page), "https://example.com", retry=-1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_moves_referer_header_to_referrer() -> None:
+    page = _FakePage([_ok_result(), _ok_result()])
+
+    resp = await HumanPage.fetch(
+        cast(HumanPage, page),
+        "https://example.com",
+        headers={"Referer": "https://ref.example/", "X-Token": "1"},
+    )
+    await HumanPage.fetch(
+        cast(HumanPage, page),
+        "https://example.com",
+        headers={"Referer": "https://ref.example/"},
+        referrer="https://explicit.example/",
+    )
+
+    assert page.payloads[0]["headers"] == {"x-token": "1"}
+    assert page.payloads[0]["ref"] == "https://ref.example/"
+    assert page.payloads[1]["headers"] == {}
+    assert page.payloads[1]["ref"] == "https://explicit.example/"
+    assert resp.request.headers == {"referer": "https://ref.example/", "x-token": "1"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_gives_response_its_own_url_without_redirect() -> None:
+    same = _ok_result()
+    same["finalUrl"] = "https://example.com/api?q=1"
+    page = _FakePage([same, _ok_result()])
+
+    resp = await HumanPage.fetch(cast(HumanPage, page), "https://example.com/api?q=1")
+    redirected = await HumanPage.fetch(cast(HumanPage, page), "https://example.com/api")
+
+    assert resp.url == resp.request.url
+    assert resp.url is not resp.request.url
+    resp.url.params["q"].append("2")
+    assert resp.request.url.params == {"q": ["1"]}
+    assert redirected.url.full_url == "https://example.com/final"
+    assert redirected.request.url.full_url == "https://example.com/api"
+
+
+@pytest.mark.asyncio
+async def test_fetch_serializes_json_body_compactly() -> None:
+    page = _FakePage([_ok_result()])
+
+    await HumanPage.fetch(
+        cast(HumanPage, page),
+        "https://example.com",
+        method=HttpMethod.POST,
+        body={"name": "значение", "items": [1, 2]},
+    )
+
+    assert page.payloads[0]["body"] == '{"name":"значение","items":[1,2]}'
+    assert page.payloads[0]["headers"] == {"content-type": "application/json"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_drops_transport_headers_from_decoded_body() -> None:
+    result = _ok_result()
+    result["headers"] = {
+        "content-type": "application/json",
+        "content-encoding": "gzip",
+        "content-length": "10",
+    }
+    page = _FakePage([result])
+
+    resp = await HumanPage.fetch(cast(HumanPage, page), "https://example.com")
+
+    assert resp.headers == {"content-type": "application/json"}
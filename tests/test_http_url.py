@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from human_requests.abstraction import URL
+
+
+def test_url_components_are_parsed() -> None:
+    url = URL(full_url="https://example.com:8443/api/items?a=1&a=2&b=x#top")
+
+    assert url.base_url == "https://example.com:8443/api/items#top"
+    assert url.secure is True
+    assert url.protocol == "https"
+    assert url.path == "/api/items"
+    assert url.domain_with_port == "example.com:8443"
+    assert url.domain == "example.com"
+    assert url.port == 8443
+    assert url.params == {"a": ["1", "2"], "b": ["x"]}
+
+
+def test_url_params_are_owned_by_each_instance() -> None:
+    url = URL(full_url="http://example.com/?q=1")
+
+    url.params["q"].append("2")
+
+    assert url.params == {"q": ["1", "2"]}
+    assert URL(full_url="http://example.com/?q=1").params == {"q": ["1"]}
+    assert url.port is None
+    assert url.secure is False
+
+
+def test_url_can_be_copied_after_parsing() -> None:
+    url = URL(full_url="https://example.com:8443/?q=1")
+    assert url.port == 8443
+    assert url.params == {"q": ["1"]}
+
+    for clone in (pickle.loads(pickle.dumps(url)), copy.deepcopy(url)):
+        assert clone == url
+        assert clone.port == 8443
+        assert clone.params == {"q": ["1"]}
+
+
+@pytest.mark.parametrize(
+    "full_url",
+    [
+        "http://example.com:not-a-port/",
+        "http://example.com:/",
+        "//example.com:x?a=1",
+        " //h:x/",
+        "http:/\t/h:x/",
+    ],
+)
+def test_url_rejects_invalid_port_on_construction(full_url: str) -> None:
+    with pytest.raises(ValueError):
+        URL(full_url=full_url)
+
+
+@pytest.mark.parametrize(
+    ("full_url", "port"),
+    [
+        ("http://example.com:8080", 8080),
+        ("//example.com:81/a:b?c=d:e#f:g", 81),
+        ("http://example.com/path:with:colons?x=1:2", None),
+        ("data:text/plain,a//b:c", None),
+    ],
+)
+def test_url_accepts_valid_ports(full_url: str, port: int | None) -> None:
+    assert URL(full_url=full_url).port == port
+
+
+def test_url_uses_slots() -> None:
+    url = URL(full_url="https://example.com/?q=1")
+
+    assert not hasattr(url, "__dict__")
+    assert url == URL(full_url="https://example.com/?q=1")
+
+
+def test_url_caches_are_not_dataclass_fields() -> None:
+    url = URL(full_url="https://example.com/?q=1")
+    assert url.params == {"q": ["1"]}
+
+    assert [f.name for f in dataclasses.fields(url)] == ["full_url"]
+    assert dataclasses.asdict(url) == {"full_url": "https://example.com/?q=1"}
+    assert repr(url) == "URL(full_url='https://example.com/?q=1')"
+
+
+def test_url_copy_keeps_subclass() -> None:
+    class _TaggedURL(URL):
+        __slots__ = ()
+
+    url = _TaggedURL(full_url="https://example.com/?q=1")
+
+    for clone in (copy.copy(url), copy.deepcopy(url)):
+        assert type(clone) is _TaggedURL
+        assert clone.params == {"q": ["1"]}
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+from typing import Any, cast
+
+import pytest
+
+from human_requests.abstraction import URL, FetchRequest, FetchResponse, HttpMethod
+from human_requests.human_page import HumanPage
+
+
+def _make_response(raw: bytes, headers: dict[str, str] | None = None) -> FetchResponse:
+    page = cast(HumanPage, object())
+    url = URL(full_url="https://example.com/api")
+    request = FetchRequest(page=page, method=HttpMethod.GET, url=url, headers={}, body=None)
+    return FetchResponse(
+        request=request,
+        page=page,
+        url=url,
+        headers=headers if headers is not None else {},
+        raw=raw,
+        status_code=200,
+        status_text="OK",
+        redirected=False,
+        type="basic",
+        duration=0.0,
+        end_time=0.0,
+    )
+
+
+def test_text_is_decoded_once_and_cached() -> None:
+    resp = _make_response("привет".encode("utf-8"))
+
+    first = resp.text
+    assert first == "привет"
+    assert resp.text is first
+
+
+def test_json_parses_body() -> None:
+    resp = _make_response(b'{"ok": true}', {"content-type": "application/json"})
+
+    data: Any = resp.json()
+    assert data == {"ok": True}
+
+
+def test_text_uses_declared_charset_with_extra_params() -> None:
+    resp = _make_response(
+        "привет".encode("cp1251"),
+        {"content-type": 'text/html; charset="windows-1251"; boundary=x'},
+    )
+
+    assert resp.text == "привет"
+
+
+def test_text_falls_back_to_utf8_on_unknown_charset() -> None:
+    resp = _make_response(b"hello", {"content-type": "text/plain; charset=no-such-codec"})
+
+    assert resp.text == "hello"
+
+
+@pytest.mark.parametrize("charset", ["hex", "base64", "zlib", "rot13", "uu", "undefined"])
+def test_text_falls_back_to_utf8_on_non_text_codec(charset: str) -> None:
+    resp = _make_response(b'{"ok": 1}', {"content-type": f"application/json; charset={charset}"})
+
+    assert resp.text == '{"ok": 1}'
+    assert resp.json() == {"ok": 1}
+
+
+def test_text_keeps_multibyte_charset() -> None:
+    resp = _make_response("привет".encode("utf-16"), {"content-type": "text/plain; charset=utf-16"})
+
+    assert resp.text == "привет"
+
+
+def test_json_parses_non_utf8_body_via_declared_charset() -> None:
+    body = '{"name": "привет"}'.encode("cp1251")
+    resp = _make_response(body, {"content-type": "application/json; charset=windows-1251"})
+
+    assert resp.json() == {"name": "привет"}
+
+
+def test_models_use_slots() -> None:
+    resp = _make_response(b"")
+
+    assert not hasattr(resp, "__dict__")
+    assert not hasattr(resp.request, "__dict__")
+
+
+def test_headers_are_normalized_to_lower_case() -> None:
+    resp = _make_response(
+        "привет".encode("cp1251"), {"Content-Type": "text/plain; charset=windows-1251"}
+    )
+
+    assert resp.headers == {"content-type": "text/plain; charset=windows-1251"}
+    assert resp.text == "привет"
+
+
+def test_text_replaces_undecodable_bytes() -> None:
+    resp = _make_response(b"ok \xff")
+
+    assert resp.text == "ok �"
+
+
+def test_text_cache_is_not_a_dataclass_field() -> None:
+    resp = _make_response(b"body", {"Content-Type": "text/plain"})
+    assert resp.text == "body"
+
+    assert "_text" not in {f.name for f in dataclasses.fields(resp)}
+    clone = copy.copy(resp)
+    assert clone == resp
+    assert clone.headers == {"content-type": "text/plain"}
+    assert clone.text == "body"
+
+
+def test_copy_keeps_response_subclass() -> None:
+    class _TaggedResponse(FetchResponse):
+        __slots__ = ()
+
+    resp = _make_response(b"body")
+    tagged = _TaggedResponse(*(getattr(resp, f.name) for f in dataclasses.fields(resp)))
+
+    clone = copy.copy(tagged)
+    assert type(clone) is _TaggedResponse
+    assert clone.text == "body"